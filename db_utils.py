@@ -1,9 +1,17 @@
+import logging
 import sqlite3
+import threading
+
+DB_PATH = 'sales_demo.db'
+MEMORY_DB_URI = 'file:/sales_demo_hot?vfs=memdb'
+HOT_TABLES = ('orders', 'products', 'customers')
+
+logger = logging.getLogger(__name__)
 
 # Database setup
 def init_database():
     """Create and populate sample database"""
-    conn = sqlite3.connect('sales_demo.db', check_same_thread=False)
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
     cursor = conn.cursor()
     
     # Create tables
@@ -116,3 +124,120 @@ def get_schema(conn):
         schema_text += "\n"
     
     return schema_text
+
+
+# In-memory hot-table mode
+def _connect_memory():
+    # memdb uses regular database locking, so readers wait on the busy
+    # timeout while a refresh commits instead of failing the way
+    # shared-cache connections do with "database table is locked".
+    return sqlite3.connect(MEMORY_DB_URI, uri=True, check_same_thread=False)
+
+def _connect_loader():
+    # Attached databases share the main database's VFS, so the disk file
+    # is opened as main and the memdb copy is attached as hot
+    conn = sqlite3.connect(DB_PATH, uri=True, check_same_thread=False)
+    conn.execute("ATTACH DATABASE ? AS hot", (MEMORY_DB_URI,))
+    return conn
+
+def _create_table(loader_conn, table_name):
+    columns = loader_conn.execute(f"PRAGMA main.table_info({table_name})").fetchall()
+    if not columns:
+        raise sqlite3.OperationalError(f"no such table: {table_name}")
+    definitions = [f"{col[1]} {col[2]}" for col in columns]
+    keys = [col[1] for col in sorted(columns, key=lambda col: col[5]) if col[5]]
+    if keys:
+        definitions.append(f"PRIMARY KEY ({', '.join(keys)})")
+    loader_conn.execute(
+        f"CREATE TABLE IF NOT EXISTS hot.{table_name} ({', '.join(definitions)})"
+    )
+
+def _sync_table(loader_conn, table_name):
+    """Apply inserts, updates and deletes from disk to one in-memory table.
+
+    Rows are matched on the primary key and only changed rows are written,
+    all in a single transaction.
+    """
+    columns = loader_conn.execute(f"PRAGMA hot.table_info({table_name})").fetchall()
+    keys = [col[1] for col in columns if col[5]]
+    if not keys:
+        raise sqlite3.OperationalError(f"table {table_name} has no primary key")
+    names = [col[1] for col in columns]
+    key_match = ' AND '.join(f"m.{key} = d.{key}" for key in keys)
+    changed = ' OR '.join(f"m.{name} IS NOT d.{name}" for name in names)
+
+    try:
+        loader_conn.execute(f"""
+            DELETE FROM hot.{table_name} AS m
+            WHERE NOT EXISTS (SELECT 1 FROM main.{table_name} AS d WHERE {key_match})
+        """)
+        loader_conn.execute(f"""
+            INSERT OR REPLACE INTO hot.{table_name} ({', '.join(names)})
+            SELECT {', '.join(f'd.{name}' for name in names)}
+            FROM main.{table_name} AS d
+            LEFT JOIN hot.{table_name} AS m ON {key_match}
+            WHERE {changed}
+        """)
+        loader_conn.commit()
+    except sqlite3.Error:
+        loader_conn.rollback()
+        raise
+
+def refresh_hot_tables(loader_conn, tables=HOT_TABLES):
+    """Sync each hot table from disk, logging tables that fail.
+
+    Returns True if every table was synced.
+    """
+    synced = True
+    for table_name in tables:
+        try:
+            _sync_table(loader_conn, table_name)
+        except sqlite3.Error:
+            logger.exception("Refreshing hot table %s failed", table_name)
+            synced = False
+    return synced
+
+def init_memory_database(tables=HOT_TABLES):
+    """Load hot tables from DB_PATH into a shared in-memory database.
+
+    The returned connection only sees the in-memory copy and keeps it
+    alive; close it to release the copy.
+    """
+    loader_conn = _connect_loader()
+    try:
+        for table_name in tables:
+            _create_table(loader_conn, table_name)
+            _sync_table(loader_conn, table_name)
+        conn = _connect_memory()
+    finally:
+        loader_conn.close()
+    return conn
+
+def start_refresh(interval=30.0, tables=HOT_TABLES):
+    """Periodically sync the in-memory hot tables from disk.
+
+    Runs on a daemon thread with its own connection, so dashboard reads
+    against the in-memory database never touch the disk path. Ticks where
+    the disk database has not changed are skipped. Returns the stop event
+    and the thread; set the event to stop refreshing.
+    """
+    stop_event = threading.Event()
+
+    def _refresh_loop():
+        loader_conn = _connect_loader()
+        last_version = None
+        try:
+            while not stop_event.wait(interval):
+                try:
+                    version = loader_conn.execute("PRAGMA main.data_version").fetchone()[0]
+                except sqlite3.Error:
+                    logger.exception("Checking hot tables for changes failed")
+                    continue
+                if version != last_version and refresh_hot_tables(loader_conn, tables):
+                    last_version = version
+        finally:
+            loader_conn.close()
+
+    thread = threading.Thread(target=_refresh_loop, name='hot-table-refresh', daemon=True)
+    thread.start()
+    return stop_event, thread
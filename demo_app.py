@@ -22,7 +22,10 @@ if "query_history" not in st.session_state:
 # Database setup
 @st.cache_resource
 def init_database():
-    conn = db_utils.init_database()
+    db_utils.init_database().close()
+    # Serve dashboard reads from an in-memory copy of the hot tables
+    conn = db_utils.init_memory_database()
+    db_utils.start_refresh()
     return conn
 
 
@@ -0,0 +1,138 @@
+import logging
+import sqlite3
+import threading
+import time
+
+import pytest
+
+import db_utils
+
+
+@pytest.fixture
+def dbs(tmp_path, monkeypatch):
+    monkeypatch.setattr(db_utils, 'DB_PATH', str(tmp_path / 'sales_demo.db'))
+    monkeypatch.setattr(db_utils, 'MEMORY_DB_URI', f'file:/{tmp_path.name}?vfs=memdb')
+    source_conn = db_utils.init_database()
+    mem_conn = db_utils.init_memory_database()
+    yield source_conn, mem_conn
+    mem_conn.close()
+    source_conn.close()
+
+
+def _rows(conn, table_name):
+    return conn.execute(f"SELECT * FROM {table_name} ORDER BY rowid").fetchall()
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def test_initial_load(dbs):
+    source_conn, mem_conn = dbs
+    for table_name in db_utils.HOT_TABLES:
+        assert _rows(mem_conn, table_name) == _rows(source_conn, table_name)
+    assert sorted(db_utils.get_schema(mem_conn).split("\n\n")) == sorted(
+        db_utils.get_schema(source_conn).split("\n\n")
+    )
+
+
+def test_refresh_propagates_changes(dbs):
+    source_conn, mem_conn = dbs
+    source_conn.execute("INSERT INTO orders VALUES (21, 1, 1, 1, '2024-11-01', 1299.99)")
+    source_conn.execute("UPDATE products SET price = 1 WHERE product_id = 1")
+    source_conn.execute("DELETE FROM customers WHERE customer_id = 3")
+    source_conn.execute("INSERT INTO customers VALUES (99, 'New Co', 'North', '2024-11-01')")
+    source_conn.commit()
+
+    loader_conn = db_utils._connect_loader()
+    try:
+        assert db_utils.refresh_hot_tables(loader_conn)
+    finally:
+        loader_conn.close()
+
+    for table_name in db_utils.HOT_TABLES:
+        assert _rows(mem_conn, table_name) == _rows(source_conn, table_name)
+    assert mem_conn.execute(
+        "SELECT price FROM products WHERE product_id = 1"
+    ).fetchone() == (1,)
+
+
+def test_refresh_continues_past_failing_table(dbs, caplog):
+    source_conn, mem_conn = dbs
+    source_conn.execute("ALTER TABLE orders RENAME TO orders_old")
+    source_conn.execute("UPDATE products SET price = 1 WHERE product_id = 1")
+    source_conn.commit()
+
+    loader_conn = db_utils._connect_loader()
+    try:
+        assert not db_utils.refresh_hot_tables(loader_conn)
+    finally:
+        loader_conn.close()
+
+    assert "Refreshing hot table orders failed" in caplog.text
+    assert _rows(mem_conn, 'products') == _rows(source_conn, 'products')
+
+
+def test_reads_during_refresh(dbs):
+    source_conn, mem_conn = dbs
+    source_conn.executemany(
+        "INSERT INTO orders VALUES (?, 1, 1, 1, '2024-11-01', 1.0)",
+        [(order_id,) for order_id in range(21, 20021)]
+    )
+    source_conn.commit()
+    expected_count = source_conn.execute("SELECT COUNT(*) FROM orders").fetchone()[0]
+
+    loader_conn = db_utils._connect_loader()
+    errors = []
+    counts = set()
+    done = threading.Event()
+
+    def _read():
+        while not done.is_set():
+            try:
+                counts.add(mem_conn.execute("SELECT COUNT(*) FROM orders").fetchone()[0])
+                db_utils.get_schema(mem_conn)
+            except sqlite3.Error as e:
+                errors.append(e)
+
+    reader = threading.Thread(target=_read)
+    reader.start()
+    try:
+        assert db_utils.refresh_hot_tables(loader_conn)
+        for quantity in range(2, 12):
+            source_conn.execute("UPDATE orders SET quantity = ?", (quantity,))
+            source_conn.commit()
+            assert db_utils.refresh_hot_tables(loader_conn)
+    finally:
+        done.set()
+        reader.join()
+        loader_conn.close()
+
+    assert errors == []
+    assert counts <= {20, expected_count}
+    assert _rows(mem_conn, 'orders') == _rows(source_conn, 'orders')
+
+
+def test_refresh_thread_survives_errors(dbs, caplog):
+    source_conn, mem_conn = dbs
+    caplog.set_level(logging.ERROR, logger=db_utils.__name__)
+    source_conn.execute("ALTER TABLE orders RENAME TO orders_old")
+    source_conn.commit()
+
+    stop_refresh, thread = db_utils.start_refresh(interval=0.01)
+    try:
+        assert _wait_for(lambda: "Refreshing hot table orders failed" in caplog.text)
+        assert thread.is_alive()
+
+        source_conn.execute("ALTER TABLE orders_old RENAME TO orders")
+        source_conn.execute("UPDATE orders SET quantity = 99 WHERE order_id = 1")
+        source_conn.commit()
+        assert _wait_for(lambda: _rows(mem_conn, 'orders') == _rows(source_conn, 'orders'))
+    finally:
+        stop_refresh.set()
+        thread.join()